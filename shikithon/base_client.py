@@ -10,6 +10,7 @@ from typing import (Any, AsyncIterator, Awaitable, Dict, List, Optional,
 import backoff
 from aiohttp import ClientSession, ContentTypeError, FormData
 from loguru import logger
+from pydantic_core import from_json
 
 from .endpoints import Endpoints
 from .enums import RequestType, ResponseCode
@@ -414,6 +415,7 @@ class Client:
         query: Optional[Dict[str, str]] = None,
         request_type: RequestType = RequestType.GET,
         output_logging: bool = True,
+        raw: bool = False,
     ) -> Optional[Union[Any, int]]:
         """Creates request and returns response JSON.
 
@@ -442,6 +444,9 @@ class Client:
         :param output_logging: Parameter for logging JSON response
         :type output_logging: bool
 
+        :param raw: Return JSON response as raw bytes without parsing
+        :type raw: bool
+
         :return: Response JSON, status code or None
         :rtype: Optional[Union[Any, int]]
 
@@ -495,7 +500,7 @@ class Client:
             if response.status == 401 and self._is_protected_request(url):
                 await self._refresh_and_save_tokens()
                 return await self.request(url, data, form_data, query,
-                                          request_type, output_logging)
+                                          request_type, output_logging, raw)
             elif response.status == ResponseCode.RETRY_LATER.value:
                 raise RetryLater('Hit retry later code. Retrying backoff')
             elif not response.ok:
@@ -506,27 +511,34 @@ class Client:
                     text=await response.text())
 
             logger.debug('Check if response has empty body')
-            response_text = await response.text()
-            if response_text == '':
+            response_body = await response.read()
+            if response_body == b'':
                 logger.debug('Response has empty body. ' \
                     'Returning response status')
                 return response.status
-            elif response_text == 'null':
+            elif response_body == b'null':
                 logger.debug('Response is "null". Returning None')
                 return None
 
+            if raw and response.content_type == 'application/json':
+                if response_body.strip() == b'{}':
+                    logger.debug('JSON is empty. ' \
+                        'Returning response status')
+                    return response.status
+                logger.debug('Returning raw JSON response')
+                return response_body
 
             logger.debug('Response is not empty. ' \
                 'Trying to extract JSON from response')
             try:
-                json_response = await response.json()
+                json_response = await response.json(loads=from_json)
             except ContentTypeError:
                 # Special case for such method, like
                 # /api/users/sign_out
                 if response.content_type == 'text/plain':
                     logger.debug('Failed JSON extracting.' \
                         ' Getting response text')
-                    return response_text
+                    return await response.text()
                 logger.error("Response content type isn't valid JSON")
                 raise InvalidContentType(response.content_type) from None
 
@@ -1,6 +1,7 @@
 """Custom decorators for API class."""
 
+from .cached_response import cached_response
 from .exceptions_handler import exceptions_handler
 from .method_endpoint import method_endpoint
 
-__all__ = ['method_endpoint', 'exceptions_handler']
+__all__ = ['method_endpoint', 'exceptions_handler', 'cached_response']
@@ -0,0 +1,56 @@
+"""Decorator for caching method response."""
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, TypeVar, cast
+
+from loguru import logger
+from typing_extensions import ParamSpec
+
+P = ParamSpec('P')
+R = TypeVar('R')
+
+
+def cached_response(
+        function: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """Decorator for caching response of resource method.
+
+    Used for methods without arguments, which return
+    reference data, that doesn't change between calls.
+    Empty responses are not cached, and cached lists
+    are returned as copies. Cache can be dropped
+    with resource's clear_cache method
+
+    :param function: Function to decorate
+    :type function: Callable[P, Awaitable[R]]
+
+    :return: Decorated function
+    :rtype: Callable[P, Awaitable[R]]
+    """
+
+    @wraps(function)
+    async def cached_response_wrapped(*args: P.args, **kwargs: P.kwargs) -> R:
+        """Decorator's wrapped function for caching method response.
+
+        :param args: Positional arguments
+        :type args: P.args
+
+        :param kwargs: Keyword arguments
+        :type kwargs: P.kwargs
+
+        :return: Cached or fresh result of decorated function
+        :rtype: R
+        """
+        cache: Dict[str, Any] = getattr(args[0], '_cached_responses')
+        if function.__qualname__ not in cache:
+            response = await function(*args, **kwargs)
+            if not response:
+                return response
+            cache[function.__qualname__] = response
+        else:
+            logger.debug(f'Using cached "{function.__qualname__}" response')
+
+        cached: R = cache[function.__qualname__]
+        if isinstance(cached, list):
+            return cast(R, list(cached))
+        return cached
+
+    return cached_response_wrapped
@@ -1,10 +1,10 @@
 """Model for `api/v2/abuse_requests`."""
 from typing import List
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class AbuseResponse(BaseModel):
+class AbuseResponse(ShikimoriModel):
     """Represents abuse response entity."""
     kind: str
     value: bool
@@ -1,10 +1,10 @@
 """Model for `/api/achievements`."""
 from datetime import datetime
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Achievement(BaseModel):
+class Achievement(ShikimoriModel):
     """Represents user achievement entity."""
     id: int
     neko_id: str
@@ -1,10 +1,10 @@
 """Submodel for `stats.py`."""
 from typing import List
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Activity(BaseModel):
+class Activity(ShikimoriModel):
     """Represents stats activity data."""
     name: List[int]
     value: int
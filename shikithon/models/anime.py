@@ -2,8 +2,9 @@
 from datetime import date, datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from .base import NamesList, ShikimoriModel
 from .genre import Genre
 from .image import Image
 from .screenshot import Screenshot
@@ -14,7 +15,7 @@ from .user_rate_status import UserRateStatus
 from .video import Video
 
 
-class AnimeInfo(BaseModel):
+class AnimeInfo(ShikimoriModel):
     """Represents an anime info entity."""
     id: int
     name: str
@@ -33,9 +34,9 @@ class AnimeInfo(BaseModel):
 class Anime(AnimeInfo):
     """Represents an anime entity."""
     rating: str
-    english: List[Optional[str]]
-    japanese: List[Optional[str]]
-    synonyms: List[str]
+    english: NamesList = Field(default_factory=list)
+    japanese: NamesList = Field(default_factory=list)
+    synonyms: NamesList = Field(default_factory=list)
     license_name_ru: Optional[str] = None
     duration: int
     description: Optional[str] = None
@@ -48,17 +49,17 @@ class Anime(AnimeInfo):
     thread_id: Optional[int] = None
     topic_id: Optional[int] = None
     myanimelist_id: int
-    rates_scores_stats: List[UserRateScore]
-    rates_statuses_stats: List[UserRateStatus]
+    rates_scores_stats: List[UserRateScore] = Field(default_factory=list)
+    rates_statuses_stats: List[UserRateStatus] = Field(default_factory=list)
     updated_at: datetime
     next_episode_at: Optional[datetime] = None
-    fansubbers: List[str]
-    fandubbers: List[str]
-    licensors: List[str]
-    genres: List[Genre]
-    studios: List[Studio]
-    videos: List[Video]
-    screenshots: List[Screenshot]
+    fansubbers: List[str] = Field(default_factory=list)
+    fandubbers: List[str] = Field(default_factory=list)
+    licensors: List[str] = Field(default_factory=list)
+    genres: List[Genre] = Field(default_factory=list)
+    studios: List[Studio] = Field(default_factory=list)
+    videos: List[Video] = Field(default_factory=list)
+    screenshots: List[Screenshot] = Field(default_factory=list)
     user_rate: Optional[UserRate] = None
 
 
@@ -2,13 +2,12 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .comment import CommentInfo
 from .user import UserInfo
 
 
-class Ban(BaseModel):
+class Ban(ShikimoriModel):
     """Represents ban entity."""
     id: int
     user_id: int
@@ -0,0 +1,30 @@
+"""Base model for other main models."""
+from typing import Any, List
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict
+from typing_extensions import Annotated
+
+
+def _drop_null_names(v: Any) -> Any:
+    if isinstance(v, list):
+        return [name for name in v if name is not None]
+    return v
+
+
+# List of title names, where API can send null instead of a name
+NamesList = Annotated[List[str], BeforeValidator(_drop_null_names)]
+
+
+class ShikimoriModel(BaseModel):
+    """Base class for all Shikimori API models.
+
+    Core schema of each model is built on its first validation
+    instead of class definition, so importing the package
+    doesn't pay for models that are never used
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class FrozenModel(ShikimoriModel):
+    """Base class for immutable value models."""
+    model_config = ConfigDict(frozen=True)
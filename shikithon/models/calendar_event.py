@@ -2,12 +2,11 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
-
 from .anime import AnimeInfo
+from .base import ShikimoriModel
 
 
-class CalendarEvent(BaseModel):
+class CalendarEvent(ShikimoriModel):
     """Represents event entity in events calendar."""
     next_episode: int
     next_episode_at: datetime
@@ -1,17 +1,17 @@
 """Submodel for `creator.py`."""
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
 from .anime import CharacterAnime
+from .base import ShikimoriModel
+from .discriminators import CharacterMangaOrRanobe
 from .image import Image
-from .manga import CharacterManga
-from .ranobe import CharacterRanobe
 from .seyu import Seyu
 
 
-class CharacterInfo(BaseModel):
+class CharacterInfo(ShikimoriModel):
     """Represents character info entity."""
     id: int
     name: str
@@ -31,6 +31,6 @@ class Character(CharacterInfo):
     thread_id: Optional[int] = None
     topic_id: Optional[int] = None
     updated_at: datetime
-    seyu: List[Seyu]
-    animes: List[CharacterAnime]
-    mangas: List[Union[CharacterManga, CharacterRanobe]]
+    seyu: List[Seyu] = Field(default_factory=list)
+    animes: List[CharacterAnime] = Field(default_factory=list)
+    mangas: List[CharacterMangaOrRanobe] = Field(default_factory=list)
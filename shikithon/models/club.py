@@ -1,9 +1,10 @@
 """Model for `/api/clubs`."""
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
 from .anime import AnimeInfo
+from .base import ShikimoriModel
 from .character import CharacterInfo
 from .club_image import ClubImage
 from .logo import Logo
@@ -11,7 +12,7 @@ from .manga import MangaInfo
 from .user import UserInfo
 
 
-class ClubInfo(BaseModel):
+class ClubInfo(ShikimoriModel):
     """Represents a club info entity."""
     id: int
     name: str
@@ -25,12 +26,12 @@ class Club(ClubInfo):
     """Represents a club entity."""
     description: Optional[str] = None
     description_html: str
-    mangas: List[MangaInfo]
-    characters: List[CharacterInfo]
+    mangas: List[MangaInfo] = Field(default_factory=list)
+    characters: List[CharacterInfo] = Field(default_factory=list)
     thread_id: int
     topic_id: int
     user_role: Optional[str] = None
     style_id: int
-    members: List[UserInfo]
-    animes: List[AnimeInfo]
-    images: List[ClubImage]
+    members: List[UserInfo] = Field(default_factory=list)
+    animes: List[AnimeInfo] = Field(default_factory=list)
+    images: List[ClubImage] = Field(default_factory=list)
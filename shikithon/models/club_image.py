@@ -1,10 +1,10 @@
 """Model for `/api/clubs/:id/images`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class ClubImage(BaseModel):
+class ClubImage(ShikimoriModel):
     """Represents club image entity."""
     id: int
     original_url: str
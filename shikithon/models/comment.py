@@ -1,12 +1,11 @@
 """Submodel for `ban.py` and model for `/api/comments`."""
 from datetime import datetime
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .user import UserInfo
 
 
-class CommentInfo(BaseModel):
+class CommentInfo(ShikimoriModel):
     """Represents a comment info entity.
 
     Used for `ban.py` model
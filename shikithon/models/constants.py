@@ -1,17 +1,17 @@
 """Model for `/api/constants`."""
 from typing import Tuple, Literal
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class AnimeConstants(BaseModel):
+class AnimeConstants(FrozenModel):
     """Represents anime constants."""
     kind: Tuple[Literal['tv'], Literal['movie'], Literal['ova'], Literal['ona'],
                 Literal['special'], Literal['music']]
     status: Tuple[Literal['anons'], Literal['ongoing'], Literal['released']]
 
 
-class MangaConstants(BaseModel):
+class MangaConstants(FrozenModel):
     """Represents manga constants."""
     kind: Tuple[Literal['manga'], Literal['manhwa'], Literal['manhua'],
                 Literal['light_novel'], Literal['novel'], Literal['one_shot'],
@@ -20,14 +20,14 @@ class MangaConstants(BaseModel):
                   Literal['paused'], Literal['discontinued']]
 
 
-class UserRateConstants(BaseModel):
+class UserRateConstants(FrozenModel):
     """Represents user rate constants."""
     status: Tuple[Literal['planned'], Literal['watching'],
                   Literal['rewatching'], Literal['completed'],
                   Literal['on_hold'], Literal['dropped']]
 
 
-class ClubConstants(BaseModel):
+class ClubConstants(FrozenModel):
     """Represents clubs constants."""
     join_policy: Tuple[
         Literal['free'],
@@ -46,7 +46,7 @@ class ClubConstants(BaseModel):
     ]
 
 
-class SmileyConstant(BaseModel):
+class SmileyConstant(FrozenModel):
     """Represents smiley constant."""
     bbcode: str
     path: str
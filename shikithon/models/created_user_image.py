@@ -1,8 +1,8 @@
 """Model for `/api/user_images`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class CreatedUserImage(BaseModel):
+class CreatedUserImage(FrozenModel):
     """Represents created user image entity."""
     id: int
     preview: str
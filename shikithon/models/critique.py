@@ -1,23 +1,20 @@
 """Submodel for `topic.py`."""
 from datetime import datetime
-from typing import Optional, Union
+from typing import Optional
 
-from pydantic import BaseModel
-
-from .anime import AnimeInfo
-from .manga import MangaInfo
-from .ranobe import RanobeInfo
+from .base import ShikimoriModel
+from .discriminators import LinkedTitle
 from .user import UserInfo
 
 
-class Critique(BaseModel):
+class Critique(ShikimoriModel):
     """Represents critique entity.
 
     Can be found in topics with type
     `Topics::EntryTopics::CritiqueTopic`
     """
     id: int
-    target: Optional[Union[AnimeInfo, MangaInfo, RanobeInfo]] = None
+    target: Optional[LinkedTitle] = None
     user: UserInfo
     votes_count: int
     votes_for: int
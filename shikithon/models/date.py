@@ -1,10 +1,10 @@
 """Submodel for `people.py`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Date(BaseModel):
+class Date(FrozenModel):
     """Date object model.
 
     Used to represent birthday or decease of person
@@ -1,11 +1,10 @@
 """Model for `/api/dialogs`."""
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .message import MessageInfo
 from .user import UserInfo
 
 
-class Dialog(BaseModel):
+class Dialog(ShikimoriModel):
     """Represents dialog entity."""
     target_user: UserInfo
     message: MessageInfo
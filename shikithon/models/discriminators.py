@@ -0,0 +1,58 @@
+"""Discriminators for unions of linked entity models."""
+from typing import Any, Optional, Union
+
+from pydantic import Discriminator, Tag
+from typing_extensions import Annotated
+
+from .anime import AnimeInfo
+from .manga import CharacterManga, MangaInfo
+from .ranobe import CharacterRanobe, RanobeInfo
+
+
+def linked_entity_tag(value: Any) -> Optional[str]:
+    """Returns tag of the model, which passed value should be parsed to.
+
+    Shikimori doesn't send the type of linked entity inside
+    its payload, so tag is picked by the fields,
+    that are unique for every entity
+
+    :param value: Raw linked entity data or already parsed model
+    :type value: Any
+
+    :return: Tag of the entity model or None, if value can't be tagged
+    :rtype: Optional[str]
+    """
+    data = value if isinstance(value, dict) else getattr(
+        value, '__dict__', None)
+    if data is None:
+        return None
+
+    if 'episodes' in data:
+        return 'Anime'
+    if 'volumes' in data:
+        return 'Ranobe' if 'novel' in str(data.get('kind')) else 'Manga'
+    if 'logo' in data:
+        return 'Club'
+    if 'votes_count' in data:
+        return 'Critique'
+    if 'image' in data and 'kind' not in data:
+        return 'Character'
+    return None
+
+
+TaggedAnimeInfo = Annotated[AnimeInfo, Tag('Anime')]
+TaggedMangaInfo = Annotated[MangaInfo, Tag('Manga')]
+TaggedRanobeInfo = Annotated[RanobeInfo, Tag('Ranobe')]
+TaggedCharacterManga = Annotated[CharacterManga, Tag('Manga')]
+TaggedCharacterRanobe = Annotated[CharacterRanobe, Tag('Ranobe')]
+
+LinkedTitle = Annotated[Union[TaggedAnimeInfo, TaggedMangaInfo,
+                              TaggedRanobeInfo],
+                        Discriminator(linked_entity_tag)]
+
+MangaOrRanobe = Annotated[Union[TaggedMangaInfo, TaggedRanobeInfo],
+                          Discriminator(linked_entity_tag)]
+
+CharacterMangaOrRanobe = Annotated[Union[TaggedCharacterManga,
+                                         TaggedCharacterRanobe],
+                                   Discriminator(linked_entity_tag)]
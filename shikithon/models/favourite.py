@@ -1,10 +1,10 @@
 """Submodel for `favourites.py`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Favourite(BaseModel):
+class Favourite(FrozenModel):
     """Represents favourite entity."""
     id: int
     name: str
@@ -1,12 +1,11 @@
 """Model for `/api/users/:id/favorites`."""
 from typing import List
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .favourite import Favourite
 
 
-class Favourites(BaseModel):
+class Favourites(ShikimoriModel):
     """Represents collection of favourites by category."""
     animes: List[Favourite]
     mangas: List[Favourite]
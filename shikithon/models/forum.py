@@ -1,8 +1,8 @@
 """Model for `/api/forums`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Forum(BaseModel):
+class Forum(FrozenModel):
     """Represents forum entity."""
     id: int
     position: int
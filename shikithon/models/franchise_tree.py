@@ -1,13 +1,12 @@
 """Model for `/api/animes|mangas|ranobe/:id/franchise`."""
 from typing import List
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .tree_link import TreeLink
 from .tree_node import TreeNode
 
 
-class FranchiseTree(BaseModel):
+class FranchiseTree(ShikimoriModel):
     """Represents franchise tree entity."""
     links: List[TreeLink]
     nodes: List[TreeNode]
@@ -1,10 +1,10 @@
 """Submodel for `anime.py`."""
 from typing import Literal
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Genre(BaseModel):
+class Genre(FrozenModel):
     """Represents genre of anime entity."""
     id: int
     name: str
@@ -1,17 +1,14 @@
 """Model for `/api/users/:id/history`."""
 from datetime import datetime
-from typing import Optional, Union
+from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
+from .discriminators import LinkedTitle
 
-from .anime import AnimeInfo
-from .manga import MangaInfo
-from .ranobe import RanobeInfo
 
-
-class History(BaseModel):
+class History(ShikimoriModel):
     """Represents user history timeline entity."""
     id: int
     created_at: datetime
     description: str
-    target: Optional[Union[AnimeInfo, MangaInfo, RanobeInfo]] = None
+    target: Optional[LinkedTitle] = None
@@ -1,8 +1,8 @@
 """Submodel for other main models."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Image(BaseModel):
+class Image(FrozenModel):
     """Represents image links entity."""
     original: str
     preview: str
@@ -0,0 +1,22 @@
+"""Submodel for `stats.py`."""
+from typing import Generic, List, Optional, TypeVar
+
+from .base import ShikimoriModel
+
+T = TypeVar('T')
+
+
+class KindList(ShikimoriModel, Generic[T]):
+    """Represents stats collection of anime/manga."""
+    anime: List[T]
+    manga: List[T]
+
+
+class OptionalKindList(ShikimoriModel, Generic[T]):
+    """Represents stats collection of anime/manga.
+
+    Used for collections, where API can omit
+    anime or manga stats
+    """
+    anime: Optional[List[T]] = None
+    manga: Optional[List[T]] = None
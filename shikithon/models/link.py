@@ -2,10 +2,10 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Link(BaseModel):
+class Link(ShikimoriModel):
     """Represents external link entity."""
     id: Optional[int] = None
     kind: str
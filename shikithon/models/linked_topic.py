@@ -2,12 +2,11 @@
 from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .image import Image
 
 
-class LinkedTopic(BaseModel):
+class LinkedTopic(ShikimoriModel):
     """Represents linked topic of message entity."""
     id: int
     topic_url: str
@@ -1,8 +1,8 @@
 """Submodel for `club.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Logo(BaseModel):
+class Logo(FrozenModel):
     """Represents club logo links entity."""
     original: str
     main: str
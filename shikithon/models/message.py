@@ -2,13 +2,14 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from .base import ShikimoriModel
 from .linked_topic import LinkedTopic
 from .user import UserInfo
 
 
-class MessageInfo(BaseModel):
+class MessageInfo(ShikimoriModel):
     """Represents message info entity."""
     id: int
     kind: str
@@ -2,15 +2,16 @@
 from datetime import datetime
 from typing import List, Optional, Tuple
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from .base import ShikimoriModel
 from .date import Date
 from .image import Image
 from .roles import Roles
 from .works import Works
 
 
-class PersonInfo(BaseModel):
+class PersonInfo(ShikimoriModel):
     """Represents person info entity."""
     id: int
     name: str
@@ -26,9 +27,9 @@ class Person(PersonInfo):
     birth_on: Date
     deceased_on: Date
     website: str
-    groupped_roles: List[Tuple[str, int]]
-    roles: List[Roles]
-    works: List[Works]
+    groupped_roles: List[Tuple[str, int]] = Field(default_factory=list)
+    roles: List[Roles] = Field(default_factory=list)
+    works: List[Works] = Field(default_factory=list)
     topic_id: Optional[int] = None
     person_favoured: bool
     producer: bool
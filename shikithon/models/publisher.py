@@ -1,8 +1,8 @@
 """Model for `/api/publishers`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Publisher(BaseModel):
+class Publisher(FrozenModel):
     """Represents publisher entity."""
     id: int
     name: str
@@ -2,8 +2,9 @@
 from datetime import date
 from typing import List, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import Field, field_validator
 
+from .base import NamesList, ShikimoriModel
 from .genre import Genre
 from .image import Image
 from .publisher import Publisher
@@ -12,7 +13,7 @@ from .user_rate_score import UserRateScore
 from .user_rate_status import UserRateStatus
 
 
-class RanobeInfo(BaseModel):
+class RanobeInfo(ShikimoriModel):
     """Represents ranobe info entity."""
     id: int
     name: str
@@ -37,9 +38,9 @@ class RanobeInfo(BaseModel):
 
 class Ranobe(RanobeInfo):
     """Represents ranobe entity."""
-    english: List[Optional[str]]
-    japanese: List[Optional[str]]
-    synonyms: List[str]
+    english: NamesList = Field(default_factory=list)
+    japanese: NamesList = Field(default_factory=list)
+    synonyms: NamesList = Field(default_factory=list)
     license_name_ru: Optional[str] = None
     description: Optional[str] = None
     description_html: str
@@ -51,11 +52,11 @@ class Ranobe(RanobeInfo):
     thread_id: Optional[int] = None
     topic_id: Optional[int] = None
     myanimelist_id: int
-    rates_scores_stats: List[UserRateScore]
-    rates_statuses_stats: List[UserRateStatus]
-    licensors: List[str]
-    genres: List[Genre]
-    publishers: List[Publisher]
+    rates_scores_stats: List[UserRateScore] = Field(default_factory=list)
+    rates_statuses_stats: List[UserRateStatus] = Field(default_factory=list)
+    licensors: List[str] = Field(default_factory=list)
+    genres: List[Genre] = Field(default_factory=list)
+    publishers: List[Publisher] = Field(default_factory=list)
     user_rate: Optional[UserRate] = None
 
 
@@ -1,8 +1,8 @@
-"""Submodel for `rating_list.py`."""
-from pydantic import BaseModel
+"""Submodel for `kind_list.py`."""
+from .base import FrozenModel
 
 
-class Rating(BaseModel):
+class Rating(FrozenModel):
     """Represents stats rating data."""
     name: str
     value: int
@@ -1,16 +1,14 @@
 """Model for `/api/animes|mangas|ranobe/:id/related`."""
-from typing import Optional, Union
-
-from pydantic import BaseModel
+from typing import Optional
 
 from .anime import AnimeInfo
-from .manga import MangaInfo
-from .ranobe import RanobeInfo
+from .base import ShikimoriModel
+from .discriminators import MangaOrRanobe
 
 
-class Relation(BaseModel):
+class Relation(ShikimoriModel):
     """Represents relation entity."""
     relation: str
     relation_russian: str
     anime: Optional[AnimeInfo] = None
-    manga: Optional[Union[MangaInfo, RanobeInfo]] = None
+    manga: Optional[MangaOrRanobe] = None
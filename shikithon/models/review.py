@@ -2,10 +2,10 @@
 from datetime import datetime
 from typing import Literal, Optional, Union
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Review(BaseModel):
+class Review(ShikimoriModel):
     """Represents review entity."""
     id: int
     user_id: int
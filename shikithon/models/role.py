@@ -1,13 +1,12 @@
 """Model for `/api/animes|mangas|ranobe/:id/roles`."""
 from typing import List, Optional
 
-from pydantic import BaseModel
-
+from .base import ShikimoriModel
 from .character import CharacterInfo
 from .person import PersonInfo
 
 
-class Role(BaseModel):
+class Role(ShikimoriModel):
     """Represents role info entity."""
     roles: List[str]
     roles_russian: List[str]
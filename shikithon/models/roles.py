@@ -1,13 +1,12 @@
 """Submodel for `people.py`."""
 from typing import List
 
-from pydantic import BaseModel
-
 from .anime import AnimeInfo
+from .base import ShikimoriModel
 from .character import CharacterInfo
 
 
-class Roles(BaseModel):
+class Roles(ShikimoriModel):
     """Represents roles entity of person."""
     characters: List[CharacterInfo]
     animes: List[AnimeInfo]
@@ -1,8 +1,8 @@
-"""Submodel for `score_list.py`."""
-from pydantic import BaseModel
+"""Submodel for `kind_list.py`."""
+from .base import FrozenModel
 
 
-class Score(BaseModel):
+class Score(FrozenModel):
     """Represents stats score data."""
     name: str
     value: int
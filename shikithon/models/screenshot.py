@@ -1,8 +1,8 @@
 """Submodel for `anime.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Screenshot(BaseModel):
+class Screenshot(FrozenModel):
     """Represents screenshot links entity."""
     original: str
     preview: str
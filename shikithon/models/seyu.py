@@ -1,10 +1,9 @@
 """Submodel for `character.py`."""
-from pydantic import BaseModel
-
+from .base import FrozenModel
 from .image import Image
 
 
-class Seyu(BaseModel):
+class Seyu(FrozenModel):
     """Represents seyu of character entity."""
     id: int
     name: str
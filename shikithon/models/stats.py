@@ -1,28 +1,36 @@
 """Submodel for `user.py`."""
-from typing import Dict, List, Optional, Union
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field, field_validator
 
 from .activity import Activity
+from .base import ShikimoriModel
 from .genre import Genre
+from .kind_list import KindList, OptionalKindList
 from .publisher import Publisher
-from .rating_list import RatingList
-from .score_list import ScoreList
-from .status_list import StatusList
+from .rating import Rating
+from .score import Score
+from .status import Status
 from .studio import Studio
-from .type_list import TypeList
+from .type import Type
 
 
-class Stats(BaseModel):
+class Stats(ShikimoriModel):
     """Represents user's stats entity."""
-    statuses: Optional[StatusList] = None
-    full_statuses: Optional[StatusList] = None
-    scores: Optional[ScoreList] = None
-    types: Optional[TypeList] = None
-    ratings: Optional[RatingList] = None
+    statuses: Optional[KindList[Status]] = None
+    full_statuses: Optional[KindList[Status]] = None
+    scores: Optional[KindList[Score]] = None
+    types: Optional[KindList[Type]] = None
+    ratings: Optional[OptionalKindList[Rating]] = None
     has_anime: Optional[bool] = Field(default=None, alias='has_anime?')
     has_manga: Optional[bool] = Field(default=None, alias='has_manga?')
-    genres: List[Genre]
-    studios: List[Studio]
-    publishers: List[Publisher]
-    activity: Optional[Union[List[Activity], Dict]] = None
+    genres: List[Genre] = Field(default_factory=list)
+    studios: List[Studio] = Field(default_factory=list)
+    publishers: List[Publisher] = Field(default_factory=list)
+    activity: List[Activity] = Field(default_factory=list)
+
+    @field_validator('activity', mode='before')
+    def activity_validator(cls, v):
+        if v is None or v == {}:
+            return []
+        return v
@@ -1,8 +1,8 @@
-"""Submodel for `status_list.py`."""
-from pydantic import BaseModel
+"""Submodel for `kind_list.py`."""
+from .base import FrozenModel
 
 
-class Status(BaseModel):
+class Status(FrozenModel):
     """Represents stats status data."""
     id: int
     grouped_id: str
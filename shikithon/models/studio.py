@@ -1,10 +1,10 @@
 """Submodel for `anime.py`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class Studio(BaseModel):
+class Studio(FrozenModel):
     """Represents studio of anime entity."""
     id: int
     name: str
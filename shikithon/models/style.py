@@ -2,10 +2,10 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Style(BaseModel):
+class Style(ShikimoriModel):
     """Represents style entity.
 
     Many fields are optional due to
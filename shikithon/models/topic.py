@@ -2,19 +2,29 @@
 from datetime import datetime
 from typing import Optional, Union
 
-from pydantic import BaseModel
+from pydantic import Discriminator, Tag
+from typing_extensions import Annotated
 
-from .anime import AnimeInfo
+from .base import ShikimoriModel
 from .club import ClubInfo
 from .character import CharacterInfo
 from .critique import Critique
-from .ranobe import RanobeInfo
+from .discriminators import (LinkedTitle, TaggedAnimeInfo, TaggedMangaInfo,
+                             TaggedRanobeInfo, linked_entity_tag)
 from .forum import Forum
-from .manga import MangaInfo
 from .user import UserInfo
 
+TaggedClubInfo = Annotated[ClubInfo, Tag('Club')]
+TaggedCharacterInfo = Annotated[CharacterInfo, Tag('Character')]
+TaggedCritique = Annotated[Critique, Tag('Critique')]
 
-class Topic(BaseModel):
+LinkedEntity = Annotated[Union[TaggedAnimeInfo, TaggedMangaInfo,
+                               TaggedRanobeInfo, TaggedClubInfo,
+                               TaggedCharacterInfo, TaggedCritique],
+                         Discriminator(linked_entity_tag)]
+
+
+class Topic(ShikimoriModel):
     """Represents topic entity.
 
     `linked` field can represent multiple models,
@@ -40,18 +50,17 @@ class Topic(BaseModel):
     type: str
     linked_id: Optional[int] = None
     linked_type: Optional[str] = None
-    linked: Optional[Union[AnimeInfo, MangaInfo, RanobeInfo, ClubInfo,
-                           CharacterInfo, Critique]] = None
+    linked: Optional[LinkedEntity] = None
     viewed: bool
     last_comment_viewed: Optional[bool] = None
     event: Optional[str] = None
     episode: Optional[int] = None
 
 
-class TopicUpdate(BaseModel):
+class TopicUpdate(ShikimoriModel):
     """Represents topic update entity."""
     id: int
-    linked: Union[AnimeInfo, MangaInfo, RanobeInfo]
+    linked: LinkedTitle
     event: Optional[str] = None
     episode: Optional[int] = None
     created_at: datetime
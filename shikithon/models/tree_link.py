@@ -1,8 +1,8 @@
 """Submodel for `franchise_tree.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class TreeLink(BaseModel):
+class TreeLink(FrozenModel):
     """Represents tree link entity."""
     id: int
     source_id: int
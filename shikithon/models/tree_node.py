@@ -1,10 +1,10 @@
 """Submodel for `franchise_tree.py`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class TreeNode(BaseModel):
+class TreeNode(FrozenModel):
     """Represents tree node entity."""
     id: int
     date: int
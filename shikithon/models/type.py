@@ -1,8 +1,8 @@
-"""Submodel for `type_list.py`."""
-from pydantic import BaseModel
+"""Submodel for `kind_list.py`."""
+from .base import FrozenModel
 
 
-class Type(BaseModel):
+class Type(FrozenModel):
     """Represents stats type data."""
     name: str
     value: int
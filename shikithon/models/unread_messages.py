@@ -1,8 +1,8 @@
 """Model for `/api/users/:id/unread_messages`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class UnreadMessages(BaseModel):
+class UnreadMessages(FrozenModel):
     """Represents counter entity for unread messages/news/notifications."""
     messages: int
     news: int
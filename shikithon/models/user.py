@@ -2,13 +2,14 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from .base import ShikimoriModel
 from .stats import Stats
 from .user_image import UserImage
 
 
-class UserInfo(BaseModel):
+class UserInfo(ShikimoriModel):
     """Represents user basic info entity."""
     id: int
     nickname: str
@@ -39,7 +40,7 @@ class User(UserPersonal):
     banned: bool
     about: str
     about_html: str
-    common_info: List[str]
+    common_info: List[str] = Field(default_factory=list)
     show_comments: bool
     in_friends: Optional[bool] = None
     is_ignored: bool
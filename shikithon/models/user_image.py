@@ -1,8 +1,8 @@
 """Submodel for `user.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class UserImage(BaseModel):
+class UserImage(FrozenModel):
     """Represents user profile links entity."""
     x160: str
     x148: str
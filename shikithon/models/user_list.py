@@ -1,16 +1,14 @@
 """Model for `/api/users/:id/anime_rates|manga_rates`."""
 from datetime import datetime
-from typing import Optional, Union
-
-from pydantic import BaseModel
+from typing import Optional
 
 from .anime import AnimeInfo
-from .manga import MangaInfo
-from .ranobe import RanobeInfo
+from .base import ShikimoriModel
+from .discriminators import MangaOrRanobe
 from .user import UserInfo
 
 
-class UserList(BaseModel):
+class UserList(ShikimoriModel):
     """Represents user list entity.
 
     Contains data of watched/read titles.
@@ -28,4 +26,4 @@ class UserList(BaseModel):
     updated_at: datetime
     user: UserInfo
     anime: Optional[AnimeInfo] = None
-    manga: Optional[Union[MangaInfo, RanobeInfo]] = None
+    manga: Optional[MangaOrRanobe] = None
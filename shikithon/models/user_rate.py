@@ -2,10 +2,10 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class UserRate(BaseModel):
+class UserRate(ShikimoriModel):
     """Represents user rate entity."""
     id: int
     user_id: Optional[int] = None
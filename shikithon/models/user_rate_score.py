@@ -1,8 +1,8 @@
 """Submodel for `anime.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class UserRateScore(BaseModel):
+class UserRateScore(FrozenModel):
     """Represents user rate score entity."""
     name: int
     value: int
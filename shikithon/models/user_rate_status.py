@@ -1,8 +1,8 @@
 """Submodel for `anime.py`."""
-from pydantic import BaseModel
+from .base import FrozenModel
 
 
-class UserRateStatus(BaseModel):
+class UserRateStatus(FrozenModel):
     """Represents user rate status entity."""
     name: str
     value: int
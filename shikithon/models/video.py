@@ -1,10 +1,10 @@
 """Model for `/api/animes/:anime_id/videos`."""
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import ShikimoriModel
 
 
-class Video(BaseModel):
+class Video(ShikimoriModel):
     """Represents a video entity."""
     id: int
     url: str
@@ -1,15 +1,13 @@
 """Submodel for `people.py`."""
-from typing import Optional, Union
-
-from pydantic import BaseModel
+from typing import Optional
 
 from .anime import AnimeInfo
-from .manga import MangaInfo
-from .ranobe import RanobeInfo
+from .base import ShikimoriModel
+from .discriminators import MangaOrRanobe
 
 
-class Works(BaseModel):
+class Works(ShikimoriModel):
     """Represents works entity of person."""
     anime: Optional[AnimeInfo] = None
-    manga: Optional[Union[MangaInfo, RanobeInfo]] = None
+    manga: Optional[MangaOrRanobe] = None
     role: str
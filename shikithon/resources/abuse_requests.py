@@ -1,5 +1,5 @@
 """Represents `/api/v2/abuse_requests` resource."""
-from typing import Any, Dict, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import RequestType, ResponseCode
@@ -31,9 +31,10 @@ class AbuseRequests(BaseResource):
         response = await self._client.request(
             self._client.endpoints.abuse_offtopic,
             data=data_dict,
-            request_type=RequestType.POST)
+            request_type=RequestType.POST,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=AbuseResponse)
 
     @method_endpoint('/api/v2/abuse_requests/review')
@@ -1,6 +1,6 @@
 """Represents `/api/achievements` resource."""
 
-from typing import Any, Dict, List, cast
+from typing import cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -29,8 +29,8 @@ class Achievements(BaseResource):
         query_dict = Utils.create_query_dict(user_id=user_id)
 
         response = await self._client.request(
-            self._client.endpoints.achievements, query=query_dict)
+            self._client.endpoints.achievements, query=query_dict, raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Achievement)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Achievement,
+                                            is_list=True)
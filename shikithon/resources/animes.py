@@ -1,5 +1,5 @@
 """Represents `/api/animes` and `/api/animes/:anime_id/videos` resources."""
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import List, Optional, Union, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import (AnimeCensorship, AnimeDuration, AnimeKind, AnimeList,
@@ -122,11 +122,12 @@ class Animes(BaseResource):
                                              search=search)
 
         response = await self._client.request(self._client.endpoints.animes,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=AnimeInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=AnimeInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -140,9 +141,9 @@ class Animes(BaseResource):
         :rtype: Optional[Anime]
         """
         response = await self._client.request(
-            self._client.endpoints.anime(anime_id))
+            self._client.endpoints.anime(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Anime)
 
     @method_endpoint('/api/animes/:id/roles')
@@ -157,11 +158,11 @@ class Animes(BaseResource):
         :rtype: List[Role]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_roles(anime_id))
+            self._client.endpoints.anime_roles(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Role)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Role,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id/similar')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -175,11 +176,11 @@ class Animes(BaseResource):
         :rtype: List[AnimeInfo]
         """
         response = await self._client.request(
-            self._client.endpoints.similar_animes(anime_id))
+            self._client.endpoints.similar_animes(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=AnimeInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=AnimeInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id/related')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -193,11 +194,11 @@ class Animes(BaseResource):
         :rtype: List[Relation]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_related_content(anime_id))
+            self._client.endpoints.anime_related_content(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Relation)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Relation,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id/screenshots')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -211,11 +212,11 @@ class Animes(BaseResource):
         :rtype: List[Screenshot]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_screenshots(anime_id))
+            self._client.endpoints.anime_screenshots(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Screenshot)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Screenshot,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id/franchise')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -229,9 +230,9 @@ class Animes(BaseResource):
         :rtype: Optional[FranchiseTree]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_franchise_tree(anime_id))
+            self._client.endpoints.anime_franchise_tree(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=FranchiseTree)
 
     @method_endpoint('/api/animes/:id/external_links')
@@ -246,11 +247,11 @@ class Animes(BaseResource):
         :rtype: List[Link]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_external_links(anime_id))
+            self._client.endpoints.anime_external_links(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Link)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Link,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:id/topics')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -286,11 +287,13 @@ class Animes(BaseResource):
                                              episode=episode)
 
         response = await self._client.request(
-            self._client.endpoints.anime_topics(anime_id), query=query_dict)
+            self._client.endpoints.anime_topics(anime_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:anime_id/videos')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -304,11 +307,11 @@ class Animes(BaseResource):
         :rtype: List[Video]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_videos(anime_id))
+            self._client.endpoints.anime_videos(anime_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Video)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Video,
+                                            is_list=True)
 
     @method_endpoint('/api/animes/:anime_id/videos')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -339,9 +342,10 @@ class Animes(BaseResource):
         response = await self._client.request(
             self._client.endpoints.anime_videos(anime_id),
             data=data_dict,
-            request_type=RequestType.POST)
+            request_type=RequestType.POST,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Video)
 
     @method_endpoint('/api/animes/:anime_id/videos/:id')
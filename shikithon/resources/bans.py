@@ -1,5 +1,5 @@
 """Represents `/api/bans` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -33,8 +33,9 @@ class Bans(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(self._client.endpoints.bans_list,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Ban)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Ban,
+                                            is_list=True)
@@ -1,4 +1,6 @@
 """Base class for API resources."""
+from typing import Any, Dict
+
 from ..base_client import Client
 
 
@@ -6,3 +8,12 @@ class BaseResource:
 
     def __init__(self, client: Client):
         self._client = client
+        self._cached_responses: Dict[str, Any] = {}
+
+    def clear_cache(self):
+        """Drops cached responses of resource methods.
+
+        Next call of a method, decorated with cached_response,
+        requests fresh data from the API
+        """
+        self._cached_responses.clear()
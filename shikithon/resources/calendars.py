@@ -1,5 +1,5 @@
 """Represents `/api/calendar` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import AnimeCensorship
@@ -29,8 +29,9 @@ class Calendars(BaseResource):
         query_dict = Utils.create_query_dict(censored=censored)
 
         response = await self._client.request(self._client.endpoints.calendar,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=CalendarEvent)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=CalendarEvent,
+                                            is_list=True)
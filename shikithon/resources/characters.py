@@ -1,5 +1,5 @@
 """Represents `/api/characters` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -26,9 +26,9 @@ class Characters(BaseResource):
         :rtype: Optional[Character]
         """
         response = await self._client.request(
-            self._client.endpoints.character(character_id))
+            self._client.endpoints.character(character_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Character)
 
     @method_endpoint('/api/characters/search')
@@ -45,8 +45,8 @@ class Characters(BaseResource):
         query_dict = Utils.create_query_dict(search=search)
 
         response = await self._client.request(
-            self._client.endpoints.character_search, query=query_dict)
+            self._client.endpoints.character_search, query=query_dict, raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=CharacterInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=CharacterInfo,
+                                            is_list=True)
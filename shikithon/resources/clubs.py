@@ -1,5 +1,5 @@
 """Represents `/api/clubs` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import List, Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import (CommentPolicy, ImageUploadPolicy, JoinPolicy, PagePolicy,
@@ -43,11 +43,12 @@ class Clubs(BaseResource):
                                              search=search)
 
         response = await self._client.request(self._client.endpoints.clubs,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=ClubInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=ClubInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -61,9 +62,9 @@ class Clubs(BaseResource):
         :rtype: Optional[Club]
         """
         response = await self._client.request(
-            self._client.endpoints.club(club_id))
+            self._client.endpoints.club(club_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Club)
 
     @method_endpoint('/api/clubs/:id')
@@ -181,9 +182,10 @@ class Clubs(BaseResource):
         response = await self._client.request(
             self._client.endpoints.club(club_id),
             form_data=form_data,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Club)
 
     @method_endpoint('/api/clubs/:id/animes')
@@ -203,11 +205,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_animes(club_id), query=query_dict)
+            self._client.endpoints.club_animes(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=AnimeInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=AnimeInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/mangas')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -226,11 +230,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_mangas(club_id), query=query_dict)
+            self._client.endpoints.club_mangas(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=MangaInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=MangaInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/ranobe')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -249,11 +255,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_ranobe(club_id), query=query_dict)
+            self._client.endpoints.club_ranobe(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=RanobeInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=RanobeInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/characters')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -272,11 +280,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_characters(club_id), query=query_dict)
+            self._client.endpoints.club_characters(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=CharacterInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=CharacterInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/collections')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -295,11 +305,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_collections(club_id), query=query_dict)
+            self._client.endpoints.club_collections(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/clubs')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -318,11 +330,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page)
 
         response = await self._client.request(
-            self._client.endpoints.club_clubs(club_id), query=query_dict)
+            self._client.endpoints.club_clubs(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=ClubInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=ClubInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/members')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -347,11 +361,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(
-            self._client.endpoints.club_members(club_id), query=query_dict)
+            self._client.endpoints.club_members(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/images')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -376,11 +392,13 @@ class Clubs(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(
-            self._client.endpoints.club_images(club_id), query=query_dict)
+            self._client.endpoints.club_images(club_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=ClubImage)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=ClubImage,
+                                            is_list=True)
 
     @method_endpoint('/api/clubs/:id/join')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=False)
@@ -1,5 +1,5 @@
 """Represents `/api/comments` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from loguru import logger
 
@@ -54,11 +54,12 @@ class Comments(BaseResource):
                                              desc=desc)
 
         response = await self._client.request(self._client.endpoints.comments,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Comment)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Comment,
+                                            is_list=True)
 
     @method_endpoint('/api/comments/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -72,9 +73,9 @@ class Comments(BaseResource):
         :rtype: Optional[Comment]
         """
         response = await self._client.request(
-            self._client.endpoints.comment(comment_id))
+            self._client.endpoints.comment(comment_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Comment)
 
     @method_endpoint('/api/comments')
@@ -120,9 +121,10 @@ class Comments(BaseResource):
 
         response = await self._client.request(self._client.endpoints.comments,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Comment)
 
     @method_endpoint('/api/comments/:id')
@@ -147,9 +149,10 @@ class Comments(BaseResource):
         response = await self._client.request(
             self._client.endpoints.comment(comment_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Comment)
 
     @method_endpoint('/api/comments/:id')
@@ -1,7 +1,7 @@
 """Represents `/api/constants` resource."""
-from typing import Any, Dict, List, cast
+from typing import cast
 
-from ..decorators import exceptions_handler, method_endpoint
+from ..decorators import cached_response, exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
 from ..models import (AnimeConstants, ClubConstants, MangaConstants,
                       SmileyConstant, UserRateConstants)
@@ -17,6 +17,7 @@ class Constants(BaseResource):
 
     @method_endpoint('/api/constants/anime')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
+    @cached_response
     async def anime(self):
         """Returns anime constants values.
 
@@ -24,13 +25,14 @@ class Constants(BaseResource):
         :rtype: Optional[AnimeConstants]
         """
         response = await self._client.request(
-            self._client.endpoints.anime_constants)
+            self._client.endpoints.anime_constants, raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=AnimeConstants)
 
     @method_endpoint('/api/constants/manga')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
+    @cached_response
     async def manga(self):
         """Returns manga constants values.
 
@@ -38,13 +40,14 @@ class Constants(BaseResource):
         :rtype: Optional[MangaConstants]
         """
         response = await self._client.request(
-            self._client.endpoints.manga_constants)
+            self._client.endpoints.manga_constants, raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=MangaConstants)
 
     @method_endpoint('/api/constants/user_rate')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
+    @cached_response
     async def user_rate(self):
         """Returns user rate constants values.
 
@@ -52,13 +55,14 @@ class Constants(BaseResource):
         :rtype: Optional[UserRateConstants]
         """
         response = await self._client.request(
-            self._client.endpoints.user_rate_constants)
+            self._client.endpoints.user_rate_constants, raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserRateConstants)
 
     @method_endpoint('/api/constants/club')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
+    @cached_response
     async def club(self):
         """Returns club constants values.
 
@@ -66,13 +70,14 @@ class Constants(BaseResource):
         :rtype: Optional[ClubConstants]
         """
         response = await self._client.request(
-            self._client.endpoints.club_constants)
+            self._client.endpoints.club_constants, raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=ClubConstants)
 
     @method_endpoint('/api/constants/smileys')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
+    @cached_response
     async def smileys(self):
         """Returns list of smiley constant values.
 
@@ -80,8 +85,8 @@ class Constants(BaseResource):
         :rtype: List[SmileyConstant]
         """
         response = await self._client.request(
-            self._client.endpoints.smileys_constants)
+            self._client.endpoints.smileys_constants, raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=SmileyConstant)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=SmileyConstant,
+                                            is_list=True)
@@ -1,5 +1,5 @@
 """Represents `/api/dialogs` resource."""
-from typing import Any, Dict, List, Union, cast
+from typing import Union, cast
 
 from loguru import logger
 
@@ -25,11 +25,12 @@ class Dialogs(BaseResource):
         :return: List of dialogs
         :rtype: List[Dialog]
         """
-        response = await self._client.request(self._client.endpoints.dialogs)
+        response = await self._client.request(self._client.endpoints.dialogs,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Dialog)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Dialog,
+                                            is_list=True)
 
     @method_endpoint('/api/dialogs/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -43,11 +44,11 @@ class Dialogs(BaseResource):
         :rtype: List[Message]
         """
         response = await self._client.request(
-            self._client.endpoints.dialog(user_id))
+            self._client.endpoints.dialog(user_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Message)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Message,
+                                            is_list=True)
 
     @method_endpoint('/api/dialogs/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=False)
@@ -1,5 +1,5 @@
 """Represents `/api/forums` resource."""
-from typing import Any, Dict, List, cast
+from typing import cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -22,8 +22,9 @@ class Forums(BaseResource):
         :returns: List of forums
         :rtype: List[Forum]
         """
-        response = await self._client.request(self._client.endpoints.forums)
+        response = await self._client.request(self._client.endpoints.forums,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Forum)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Forum,
+                                            is_list=True)
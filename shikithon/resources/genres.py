@@ -1,5 +1,5 @@
 """Represents `/api/genres` resource."""
-from typing import Any, Dict, List, cast
+from typing import cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -22,8 +22,9 @@ class Genres(BaseResource):
         :return: List of genres
         :rtype: List[Genre]
         """
-        response = await self._client.request(self._client.endpoints.genres)
+        response = await self._client.request(self._client.endpoints.genres,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Genre)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Genre,
+                                            is_list=True)
@@ -1,5 +1,5 @@
 """Represents `/api/mangas` resource."""
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import List, Optional, Union, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import (MangaCensorship, MangaKind, MangaList, MangaOrder,
@@ -105,11 +105,12 @@ class Mangas(BaseResource):
                                              search=search)
 
         response = await self._client.request(self._client.endpoints.mangas,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=MangaInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=MangaInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/mangas/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -123,9 +124,9 @@ class Mangas(BaseResource):
         :rtype: Optional[Manga]
         """
         response = await self._client.request(
-            self._client.endpoints.manga(manga_id))
+            self._client.endpoints.manga(manga_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Manga)
 
     @method_endpoint('/api/mangas/:id/roles')
@@ -140,11 +141,11 @@ class Mangas(BaseResource):
         :rtype: List[Role]
         """
         response = await self._client.request(
-            self._client.endpoints.manga_roles(manga_id))
+            self._client.endpoints.manga_roles(manga_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Role)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Role,
+                                            is_list=True)
 
     @method_endpoint('/api/mangas/:id/similar')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -158,7 +159,7 @@ class Mangas(BaseResource):
         :rtype: List[Union[MangaInfo, RanobeInfo]]
         """
         response = await self._client.request(
-            self._client.endpoints.similar_mangas(manga_id))
+            self._client.endpoints.similar_mangas(manga_id), raw=True)
 
         return Utils.parse_mixed_response(response, List[Union[MangaInfo,
                                                                RanobeInfo]])
@@ -175,11 +176,11 @@ class Mangas(BaseResource):
         :rtype: List[Relation]
         """
         response = await self._client.request(
-            self._client.endpoints.manga_related_content(manga_id))
+            self._client.endpoints.manga_related_content(manga_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Relation)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Relation,
+                                            is_list=True)
 
     @method_endpoint('/api/mangas/:id/franchise')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -193,9 +194,9 @@ class Mangas(BaseResource):
         :rtype: Optional[FranchiseTree]
         """
         response = await self._client.request(
-            self._client.endpoints.manga_franchise_tree(manga_id))
+            self._client.endpoints.manga_franchise_tree(manga_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=FranchiseTree)
 
     @method_endpoint('/api/mangas/:id/external_links')
@@ -210,11 +211,11 @@ class Mangas(BaseResource):
         :rtype: List[Link]
         """
         response = await self._client.request(
-            self._client.endpoints.manga_external_links(manga_id))
+            self._client.endpoints.manga_external_links(manga_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Link)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Link,
+                                            is_list=True)
 
     @method_endpoint('/api/mangas/:id/topics')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -239,8 +240,10 @@ class Mangas(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(
-            self._client.endpoints.manga_topics(manga_id), query=query_dict)
+            self._client.endpoints.manga_topics(manga_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
@@ -1,5 +1,5 @@
 """Represents `/api/messages` resource."""
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import List, Optional, Union, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import MessageType, RequestType, ResponseCode
@@ -30,9 +30,9 @@ class Messages(BaseResource):
         :rtype: Optional[Message]
         """
         response = await self._client.request(
-            self._client.endpoints.message(message_id))
+            self._client.endpoints.message(message_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Message)
 
     @method_endpoint('/api/messages')
@@ -61,9 +61,10 @@ class Messages(BaseResource):
 
         response = await self._client.request(self._client.endpoints.messages,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Message)
 
     @method_endpoint('/api/messages/:id')
@@ -86,9 +87,10 @@ class Messages(BaseResource):
         response = await self._client.request(
             self._client.endpoints.message(message_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Message)
 
     @method_endpoint('/api/messages/:id')
@@ -1,5 +1,5 @@
 """Represents `/api/people` resource."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import PersonSearchKind
@@ -27,9 +27,9 @@ class People(BaseResource):
         :rtype: Optional[Person]
         """
         response = await self._client.request(
-            self._client.endpoints.people(people_id))
+            self._client.endpoints.people(people_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Person)
 
     @method_endpoint('/api/people/search')
@@ -51,8 +51,8 @@ class People(BaseResource):
         query_dict = Utils.create_query_dict(search=search, kind=people_kind)
 
         response = await self._client.request(
-            self._client.endpoints.people_search, query=query_dict)
+            self._client.endpoints.people_search, query=query_dict, raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=PersonInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=PersonInfo,
+                                            is_list=True)
@@ -1,5 +1,5 @@
 """Represents `/api/publishers` resource."""
-from typing import Any, Dict, List, cast
+from typing import cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -22,8 +22,9 @@ class Publishers(BaseResource):
         :return: List of publishers
         :rtype: List[Publisher]
         """
-        response = await self._client.request(self._client.endpoints.publishers)
+        response = await self._client.request(self._client.endpoints.publishers,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Publisher)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Publisher,
+                                            is_list=True)
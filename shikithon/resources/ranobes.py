@@ -1,5 +1,5 @@
 """Represents `/api/ranobes` resource."""
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import List, Optional, Union, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import RanobeCensorship, RanobeList, RanobeOrder, RanobeStatus
@@ -99,11 +99,12 @@ class Ranobes(BaseResource):
                                              search=search)
 
         response = await self._client.request(self._client.endpoints.ranobes,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=RanobeInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=RanobeInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/ranobe/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -117,9 +118,9 @@ class Ranobes(BaseResource):
         :rtype: Optional[Ranobe]
         """
         response = await self._client.request(
-            self._client.endpoints.ranobe(ranobe_id))
+            self._client.endpoints.ranobe(ranobe_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Ranobe)
 
     @method_endpoint('/api/ranobe/:id/roles')
@@ -134,11 +135,11 @@ class Ranobes(BaseResource):
         :rtype: List[Role]
         """
         response = await self._client.request(
-            self._client.endpoints.ranobe_roles(ranobe_id))
+            self._client.endpoints.ranobe_roles(ranobe_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Role)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Role,
+                                            is_list=True)
 
     @method_endpoint('/api/ranobe/:id/similar')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -152,7 +153,7 @@ class Ranobes(BaseResource):
         :rtype: List[Union[MangaInfo, RanobeInfo]]
         """
         response = await self._client.request(
-            self._client.endpoints.similar_ranobes(ranobe_id))
+            self._client.endpoints.similar_ranobes(ranobe_id), raw=True)
 
         return Utils.parse_mixed_response(response, List[Union[MangaInfo,
                                                                RanobeInfo]])
@@ -169,11 +170,11 @@ class Ranobes(BaseResource):
         :rtype: List[Relation]
         """
         response = await self._client.request(
-            self._client.endpoints.ranobe_related_content(ranobe_id))
+            self._client.endpoints.ranobe_related_content(ranobe_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Relation)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Relation,
+                                            is_list=True)
 
     @method_endpoint('/api/ranobe/:id/franchise')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -187,9 +188,9 @@ class Ranobes(BaseResource):
         :rtype: Optional[FranchiseTree]
         """
         response = await self._client.request(
-            self._client.endpoints.ranobe_franchise_tree(ranobe_id))
+            self._client.endpoints.ranobe_franchise_tree(ranobe_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=FranchiseTree)
 
     @method_endpoint('/api/ranobe/:id/external_links')
@@ -204,11 +205,11 @@ class Ranobes(BaseResource):
         :rtype: List[Link]
         """
         response = await self._client.request(
-            self._client.endpoints.ranobe_external_links(ranobe_id))
+            self._client.endpoints.ranobe_external_links(ranobe_id), raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Link)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Link,
+                                            is_list=True)
 
     @method_endpoint('/api/ranobe/:id/topics')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -233,8 +234,10 @@ class Ranobes(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(
-            self._client.endpoints.ranobe_topics(ranobe_id), query=query_dict)
+            self._client.endpoints.ranobe_topics(ranobe_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
@@ -1,5 +1,5 @@
 """Represents `/api/reviews` resource."""
-from typing import Any, Dict, Optional, cast
+from typing import Optional, cast
 
 from loguru import logger
 
@@ -44,9 +44,10 @@ class Reviews(BaseResource):
 
         response = await self._client.request(self._client.endpoints.reviews,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Review)
 
     # @method_endpoint('/api/reviews')
@@ -99,9 +100,10 @@ class Reviews(BaseResource):
         response = await self._client.request(
             self._client.endpoints.review(review_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Review)
 
     @method_endpoint('/api/reviews/:id')
@@ -1,5 +1,5 @@
 """Represents `/api/studios` resource."""
-from typing import Any, Dict, List, cast
+from typing import cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..exceptions import ShikimoriAPIResponseError
@@ -22,8 +22,9 @@ class Studios(BaseResource):
         :return: List of studios
         :rtype: List[Studio]
         """
-        response = await self._client.request(self._client.endpoints.studios)
+        response = await self._client.request(self._client.endpoints.studios,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Studio)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Studio,
+                                            is_list=True)
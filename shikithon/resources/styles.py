@@ -1,5 +1,5 @@
 """Represents `/api/styles` resource."""
-from typing import Any, Dict, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import RequestType, StyleOwner
@@ -29,9 +29,9 @@ class Styles(BaseResource):
         :rtype: Optional[Style]
         """
         response = await self._client.request(
-            self._client.endpoints.style(style_id))
+            self._client.endpoints.style(style_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Style)
 
     @method_endpoint('/api/styles/preview')
@@ -50,9 +50,10 @@ class Styles(BaseResource):
         response = await self._client.request(
             self._client.endpoints.style_preview,
             data=data_dict,
-            request_type=RequestType.POST)
+            request_type=RequestType.POST,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Style)
 
     @method_endpoint('/api/styles')
@@ -84,9 +85,10 @@ class Styles(BaseResource):
 
         response = await self._client.request(self._client.endpoints.styles,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Style)
 
     @method_endpoint('/api/styles/:id')
@@ -116,7 +118,8 @@ class Styles(BaseResource):
         response = await self._client.request(
             self._client.endpoints.style(style_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Style)
@@ -1,5 +1,5 @@
 """Represents `/api/topics` and `/api/v2/topics` resources."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Optional, cast
 
 from loguru import logger
 
@@ -59,11 +59,12 @@ class Topics(BaseResource):
                                             type=topic_type)
 
         response = await self._client.request(self._client.endpoints.topics,
-                                              query=data_dict)
+                                              query=data_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
 
     @method_endpoint('/api/topics/updates')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -84,11 +85,11 @@ class Topics(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(
-            self._client.endpoints.updates_topics, query=query_dict)
+            self._client.endpoints.updates_topics, query=query_dict, raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=TopicUpdate)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=TopicUpdate,
+                                            is_list=True)
 
     @method_endpoint('/api/topics/hot')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -104,11 +105,12 @@ class Topics(BaseResource):
         query_dict = Utils.create_query_dict(limit=limit)
 
         response = await self._client.request(self._client.endpoints.hot_topics,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Topic)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Topic,
+                                            is_list=True)
 
     @method_endpoint('/api/topics/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -122,9 +124,9 @@ class Topics(BaseResource):
         :rtype: Optional[Topic]
         """
         response = await self._client.request(
-            self._client.endpoints.topic(topic_id))
+            self._client.endpoints.topic(topic_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Topic)
 
     @method_endpoint('/api/topics')
@@ -170,9 +172,10 @@ class Topics(BaseResource):
 
         response = await self._client.request(self._client.endpoints.topics,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Topic)
 
     @method_endpoint('/api/topics/:id')
@@ -212,9 +215,10 @@ class Topics(BaseResource):
         response = await self._client.request(
             self._client.endpoints.topic(topic_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Topic)
 
     @method_endpoint('/api/topics/:id')
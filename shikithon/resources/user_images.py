@@ -1,5 +1,5 @@
 """Represents `/api/user_images` resource."""
-from typing import Any, Dict, Optional, cast
+from typing import Optional, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import RequestType
@@ -37,7 +37,8 @@ class UserImages(BaseResource):
         response = await self._client.request(
             self._client.endpoints.user_images,
             form_data=form_data,
-            request_type=RequestType.POST)
+            request_type=RequestType.POST,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=CreatedUserImage)
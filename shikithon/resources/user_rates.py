@@ -1,5 +1,5 @@
 """Represents `/api/user_rates` and `/api/v2/user_rates` resources."""
-from typing import Any, Dict, List, Optional, cast
+from typing import Optional, cast
 
 from loguru import logger
 
@@ -67,11 +67,12 @@ class UserRates(BaseResource):
                                              limit=limit)
 
         response = await self._client.request(self._client.endpoints.user_rates,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserRate)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserRate,
+                                            is_list=True)
 
     @method_endpoint('/api/v2/user_rates/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -85,9 +86,9 @@ class UserRates(BaseResource):
         :rtype: Optional[UserRate]
         """
         response = await self._client.request(
-            self._client.endpoints.user_rate(rate_id))
+            self._client.endpoints.user_rate(rate_id), raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserRate)
 
     @method_endpoint('/api/v2/user_rates')
@@ -153,9 +154,10 @@ class UserRates(BaseResource):
 
         response = await self._client.request(self._client.endpoints.user_rates,
                                               data=data_dict,
-                                              request_type=RequestType.POST)
+                                              request_type=RequestType.POST,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserRate)
 
     @method_endpoint('/api/v2/user_rates/:id')
@@ -210,9 +212,10 @@ class UserRates(BaseResource):
         response = await self._client.request(
             self._client.endpoints.user_rate(rate_id),
             data=data_dict,
-            request_type=RequestType.PATCH)
+            request_type=RequestType.PATCH,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserRate)
 
     @method_endpoint('/api/v2/user_rates/:id/increment')
@@ -228,9 +231,10 @@ class UserRates(BaseResource):
         """
         response = await self._client.request(
             self._client.endpoints.user_rate_increment(rate_id),
-            request_type=RequestType.POST)
+            request_type=RequestType.POST,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserRate)
 
     @method_endpoint('/api/v2/user_rates/:id')
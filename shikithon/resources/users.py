@@ -1,5 +1,5 @@
 """Represents `/api/users` and `/api/v2/users` resources."""
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, Optional, Union, cast
 
 from ..decorators import exceptions_handler, method_endpoint
 from ..enums import (AnimeCensorship, AnimeList, HistoryTargetType, MessageType,
@@ -36,11 +36,12 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(page=page, limit=limit)
 
         response = await self._client.request(self._client.endpoints.users,
-                                              query=query_dict)
+                                              query=query_dict,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -57,9 +58,9 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user(user_id), query=query_dict)
+            self._client.endpoints.user(user_id), query=query_dict, raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=User)
 
     @method_endpoint('/api/users/:id/info')
@@ -77,9 +78,11 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user_info(user_id), query=query_dict)
+            self._client.endpoints.user_info(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserBrief)
 
     @method_endpoint('/api/users/whoami')
@@ -92,9 +95,10 @@ class Users(BaseResource):
         :return: Current user brief info
         :rtype: Optional[UserBrief]
         """
-        response = await self._client.request(self._client.endpoints.whoami)
+        response = await self._client.request(self._client.endpoints.whoami,
+                                              raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UserBrief)
 
     @method_endpoint('/api/users/sign_out')
@@ -124,11 +128,13 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user_friends(user_id), query=query_dict)
+            self._client.endpoints.user_friends(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/clubs')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -145,11 +151,13 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user_clubs(user_id), query=query_dict)
+            self._client.endpoints.user_clubs(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=ClubInfo)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=ClubInfo,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/anime_rates')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -187,11 +195,13 @@ class Users(BaseResource):
                                              censored=censored)
 
         response = await self._client.request(
-            self._client.endpoints.user_anime_rates(user_id), query=query_dict)
+            self._client.endpoints.user_anime_rates(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserList)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserList,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/manga_rates')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -224,11 +234,13 @@ class Users(BaseResource):
                                              censored=censored)
 
         response = await self._client.request(
-            self._client.endpoints.user_manga_rates(user_id), query=query_dict)
+            self._client.endpoints.user_manga_rates(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=UserList)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=UserList,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/favourites')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -245,9 +257,11 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user_favourites(user_id), query=query_dict)
+            self._client.endpoints.user_favourites(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=Favourites)
 
     @method_endpoint('/api/users/:id/messages')
@@ -281,11 +295,13 @@ class Users(BaseResource):
                                              type=message_type)
 
         response = await self._client.request(
-            self._client.endpoints.user_messages(user_id), query=query_dict)
+            self._client.endpoints.user_messages(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Message)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Message,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/unread_messages')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=None)
@@ -304,9 +320,10 @@ class Users(BaseResource):
 
         response = await self._client.request(
             self._client.endpoints.user_unread_messages(user_id),
-            query=query_dict)
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(Dict[str, Any], response),
+        return Utils.validate_response_data(cast(bytes, response),
                                             data_model=UnreadMessages)
 
     @method_endpoint('/api/users/:id/history')
@@ -345,11 +362,13 @@ class Users(BaseResource):
                                              target_type=target_type)
 
         response = await self._client.request(
-            self._client.endpoints.user_history(user_id), query=query_dict)
+            self._client.endpoints.user_history(user_id),
+            query=query_dict,
+            raw=True)
 
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=History)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=History,
+                                            is_list=True)
 
     @method_endpoint('/api/users/:id/bans')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=[])
@@ -366,10 +385,12 @@ class Users(BaseResource):
         query_dict = Utils.create_query_dict(is_nickname=is_nickname)
 
         response = await self._client.request(
-            self._client.endpoints.user_bans(user_id), query=query_dict)
-        return Utils.validate_response_data(cast(List[Dict[str, Any]],
-                                                 response),
-                                            data_model=Ban)
+            self._client.endpoints.user_bans(user_id),
+            query=query_dict,
+            raw=True)
+        return Utils.validate_response_data(cast(bytes, response),
+                                            data_model=Ban,
+                                            is_list=True)
 
     @method_endpoint('/api/v2/users/:user_id/ignore')
     @exceptions_handler(ShikimoriAPIResponseError, fallback=False)
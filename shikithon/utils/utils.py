@@ -6,11 +6,14 @@ to work with the library
 """
 
 import imghdr
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, overload
+from functools import lru_cache
+from typing import (Any, Dict, Hashable, List, Literal, Optional, Type, TypeVar,
+                    Union, cast, overload)
 
 from aiohttp import ClientResponse, ClientSession, FormData
 from loguru import logger
 from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json
 from validators import url
 
 from ..enums import ResponseCode
@@ -26,6 +29,17 @@ R = TypeVar('R')
 T = TypeVar('T')
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(data_model: Type[M]) -> TypeAdapter[List[M]]:
+    list_type: Any = List
+    return TypeAdapter(list_type[data_model])
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(parse_type: Hashable) -> TypeAdapter[Any]:
+    return TypeAdapter(parse_type)
+
+
 class Utils:
     """Utils class.
 
@@ -269,32 +283,67 @@ class Utils:
     ) -> List[M]:
         ...
 
+    @overload
     @staticmethod
     def validate_response_data(
-        response_data: Union[Dict[str, Any], List[Dict[str, Any]]],
+        response_data: bytes,
         data_model: Type[M],
+        is_list: Literal[False] = False,
+    ) -> Optional[M]:
+        ...
+
+    @overload
+    @staticmethod
+    def validate_response_data(
+        response_data: bytes,
+        data_model: Type[M],
+        is_list: Literal[True],
+    ) -> List[M]:
+        ...
+
+    @staticmethod
+    def validate_response_data(
+        response_data: Union[Dict[str, Any], List[Dict[str, Any]], bytes],
+        data_model: Type[M],
+        is_list: bool = False,
     ) -> Optional[Union[Optional[M], List[M]]]:
         """Validates passed response data and returns parsed models.
 
+        Raw JSON bytes are parsed and validated by pydantic-core
+        in one pass, without building intermediate Python objects
+
         :param response_data: Passed response data
-        :type response_data: Union[Dict[str, Any], List[Dict[str, Any]]]
+        :type response_data: Union[Dict[str, Any], List[Dict[str, Any]],
+            bytes]
 
         :param data_model: Model to convert into passed response data
         :type data_model: Type[M]
 
+        :param is_list: Whether raw JSON bytes hold a list of models
+        :type is_list: bool
+
         :return: Parsed response data
         :rtype: Optional[Union[List, Optional[M], List[M]]]
         """
         logger.debug('Validating and parsing response data '\
                     f'using "{data_model.__name__}" data model')
-        logger.debug(f'Passed response data: {response_data}')
+        logger.opt(lazy=True).debug(
+            'Passed response data: {}',
+            lambda: response_data.decode('utf-8', 'replace')
+            if isinstance(response_data, bytes) else response_data)
 
         if not response_data:
             logger.debug('Response data is empty. Returning')
-            return [] if isinstance(response_data, list) else None
+            return [] if isinstance(response_data, list) or is_list else None
+
+        if isinstance(response_data, bytes):
+            if is_list:
+                return _list_adapter(data_model).validate_json(response_data)
+            return data_model.model_validate_json(response_data)
 
-        return [data_model(**item) for item in response_data] if isinstance(
-            response_data, list) else data_model(**response_data)
+        if isinstance(response_data, list):
+            return _list_adapter(data_model).validate_python(response_data)
+        return data_model.model_validate(response_data)
 
     @staticmethod
     def parse_mixed_response(response: Any, parse_type: Type[T]):
@@ -304,7 +353,7 @@ class Utils:
         Due to fact, that every Manga and Ranobe can have both models as
         similar, this utility method helps parse response correctly
 
-        :param response: Passed response data
+        :param response: Passed response data or raw JSON bytes
         :type response: Any
 
         :param parse_type: Type for parsing response to
@@ -315,7 +364,9 @@ class Utils:
         """
         logger.info('Parsing response with mixed models')
         logger.info(f'Parsing using type: {parse_type}')
-        adapter: TypeAdapter[T] = TypeAdapter(parse_type)
+        adapter: TypeAdapter[T] = _type_adapter(cast(Hashable, parse_type))
+        if isinstance(response, bytes):
+            return adapter.validate_json(response)
         return adapter.validate_python(response)
 
     @staticmethod
@@ -404,11 +455,14 @@ class Utils:
         """
         logger.debug(f'Response status: {response.status}')
         logger.debug(f'Response headers: {response.headers}')
+        response_body = await response.read()
         if not remove_sensitive_data:
-            logger.debug(f'Response data: {await response.text()}')
+            logger.opt(lazy=True).debug(
+                'Response data: {}', lambda: response_body.decode(
+                    response.get_encoding(), 'replace'))
             return
 
-        censored_response_data: Dict[str, Any] = await response.json()
+        censored_response_data: Dict[str, Any] = from_json(response_body)
         for key in censored_response_data.keys():
             if key in CENSORED_FIELDS:
                 censored_response_data[key] = '[REDACTED]'